@@ -28,7 +28,7 @@ from shift.utils.mesh_network import get_mesh_network
 from shift.utils.split_network_edges import split_network_edges
 from shift.utils.get_cluster import get_kmeans_clusters
 from shift.utils.polygon_from_points import get_polygon_from_points
-from shift.utils.nearest_points import get_nearest_points
+from shift.utils.nearest_points import get_nearest_points, get_nearest_point_indices
 
 from shift.graph.prsgb import PRSG
 from shift.graph.distribution_graph import DistributionGraph
@@ -24,3 +24,5 @@ EQUIPMENT_TO_CLASS_TYPE = {
     GeometryBranch: GeometryBranchEquipment,
     DistributionTransformer: DistributionTransformerEquipment,
 }
+
+DEGREE_TO_METER = 111139
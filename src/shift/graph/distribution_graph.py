@@ -1,3 +1,4 @@
+from collections import Counter
 from typing import Callable, Iterable
 import copy
 
@@ -65,6 +66,7 @@ class DistributionGraph:
     def __init__(self):
         self._graph = nx.Graph()
         self.vsource_node = None
+        self._dfs_tree: nx.DiGraph | None = None
 
     def add_node(self, node: NodeModel):
         """Adds node to the graph.
@@ -99,25 +101,57 @@ class DistributionGraph:
             msg = f"{self.vsource_node=} already exists. Cannot add {node=}"
             raise VsourceNodeAlreadyExists(msg)
         self._graph.add_node(node.name, **{self.node_data_ppty: node})
+        self._dfs_tree = None
         if node.assets and DistributionVoltageSource in node.assets:
             self.vsource_node = node.name
 
     def add_nodes(self, nodes: list[NodeModel]):
         """Adds multiple nodes to the graph.
 
+        All nodes are validated before any of them is added.
+
         Parameters
         ----------
         nodes : NodeModel
             Instance of `NodeModel` to add to the graph.
 
+        Raises
+        ------
+        NodeAlreadyExists
+            Raises this exception if any node already exists
+            or is repeated in `nodes`.
+        VsourceNodeAlreadyExists:
+            Raises this exception if adding `nodes` would result in
+            more than one node with substation in assets.
+
         Examples
         --------
 
         >>> dgraph.add_nodes([sf.NodeModel(name="node_1"),
             sf.NodeModel(name="node_2")])
         """
-        for node in nodes:
-            self.add_node(node)
+        nodes = list(nodes)
+        node_counts = Counter(node.name for node in nodes)
+        existing_nodes = node_counts.keys() & self._graph.nodes.keys()
+        repeated_nodes = {name for name, count in node_counts.items() if count > 1}
+        if existing_nodes or repeated_nodes:
+            msg = (
+                f"Nodes already exist in the graph or are repeated: "
+                f"{existing_nodes=}, {repeated_nodes=}"
+            )
+            raise NodeAlreadyExists(msg)
+
+        vsource_nodes = [
+            node.name for node in nodes if node.assets and DistributionVoltageSource in node.assets
+        ]
+        if len(vsource_nodes) > 1 or (vsource_nodes and self.vsource_node is not None):
+            msg = f"{self.vsource_node=} already exists. Cannot add {vsource_nodes=}"
+            raise VsourceNodeAlreadyExists(msg)
+
+        self._graph.add_nodes_from((node.name, {self.node_data_ppty: node}) for node in nodes)
+        self._dfs_tree = None
+        if vsource_nodes:
+            self.vsource_node = vsource_nodes[0]
 
     def add_edge(self, from_node: str | NodeModel, to_node: str | NodeModel, edge_data: EdgeModel):
         """Adds edge to the graph.
@@ -163,6 +197,52 @@ class DistributionGraph:
             )
             raise NodeDoesNotExist(msg)
         self._graph.add_edge(from_node_name, to_node_name, **{self.edge_data_ppty: edge_data})
+        self._dfs_tree = None
+
+    def add_edges(self, edges: list[tuple[str, str, EdgeModel]]):
+        """Adds multiple edges to the graph.
+
+        All edges are validated before any of them is added. Unlike `add_edge`,
+        nodes must already exist in the graph.
+
+        Parameters
+        ----------
+        edges : list[tuple[str, str, EdgeModel]]
+            List of from node name, to node name and `EdgeModel` tuples.
+
+        Raises
+        ------
+        EdgeAlreadyExists
+            Raises this exception if any edge already exists
+            or is repeated in `edges`.
+        NodeDoesNotExist
+            Raises this exception if any of the nodes does not exist.
+
+        Examples
+        --------
+
+        >>> dgraph.add_edges([("node_1", "node_2", edge_data_1),
+            ("node_2", "node_3", edge_data_2)])
+        """
+        new_edges = set()
+        for from_node, to_node, _ in edges:
+            edge = frozenset((from_node, to_node))
+            if self._graph.has_edge(from_node, to_node) or edge in new_edges:
+                msg = f"Edge already exists between {from_node=} and {to_node=}"
+                raise EdgeAlreadyExists(msg)
+            if not (self._graph.has_node(from_node) and self._graph.has_node(to_node)):
+                msg = (
+                    f"Either {from_node=} or {to_node=} does not exist. Make sure "
+                    f"they are added to the graph before creating an edge."
+                )
+                raise NodeDoesNotExist(msg)
+            new_edges.add(edge)
+
+        self._graph.add_edges_from(
+            (from_node, to_node, {self.edge_data_ppty: edge_data})
+            for from_node, to_node, edge_data in edges
+        )
+        self._dfs_tree = None
 
     def get_node(self, node_name: str) -> NodeModel:
         """Get node data by node name.
@@ -181,7 +261,7 @@ class DistributionGraph:
 
         >>> dgraph.get_node("node_1")
         """
-        if node_name not in list(self._graph.nodes):
+        if not self._graph.has_node(node_name):
             msg = f"{node_name=} does not exist in the graph."
             raise NodeDoesNotExist(msg)
 
@@ -216,9 +296,11 @@ class DistributionGraph:
 
         >>> dgraph.get_nodes(filter_func=lambda x: "tr" in x)
         """
-        for node in self._graph.nodes:
-            node_obj = self.get_node(node)
-            if (filter_func and filter_func(node_obj)) or filter_func is None:
+        for node_name, node_obj in self._graph.nodes(data=self.node_data_ppty):
+            if not isinstance(node_obj, NodeModel):
+                msg = f"{node_obj=} is not of type NodeModel for {node_name=}"
+                raise ValueError(msg)
+            if filter_func is None or filter_func(node_obj):
                 yield node_obj
 
     def remove_node(self, node_name: str):
@@ -235,6 +317,7 @@ class DistributionGraph:
         >>> dgraph.remove_node("node_1")
         """
         self._graph.remove_node(node_name)
+        self._dfs_tree = None
 
     def has_node(self, node_name: str) -> bool:
         """Function to check whether node already exists or not.
@@ -273,6 +356,7 @@ class DistributionGraph:
         >>> dgraph.remove_edge("node_1", "node_2")
         """
         self._graph.remove_edge(from_node, to_node)
+        self._dfs_tree = None
 
     def get_edge(self, from_node: str, to_node: str) -> EdgeModel:
         """Get edge data.
@@ -326,18 +410,26 @@ class DistributionGraph:
         -------
         Iterable[tuple[str, str, EdgeModel]]
         """
-        for edge in self._graph.edges:
-            edge_data = self.get_edge(*edge)
+        for from_node, to_node, edge_data in self._graph.edges(data=self.edge_data_ppty):
+            if not isinstance(edge_data, EdgeModel):
+                msg = f"{edge_data=} is not of type {EdgeModel} for {from_node, to_node}"
+                raise ValueError(msg)
             if filter_func and not filter_func(edge_data):
                 continue
-            yield tuple([edge[0], edge[1], edge_data])
+            yield from_node, to_node, edge_data
 
     def get_undirected_graph(self) -> nx.Graph:
         """Method to return undirected graph."""
         return copy.deepcopy(self._graph)
 
     def get_dfs_tree(self) -> nx.DiGraph:
-        """Internal method to directed dfs tree from vsource."""
+        """Method to return directed dfs tree from vsource.
+
+        The tree is computed once and reused until the graph is modified.
+        Returned tree is frozen and can not be modified.
+        """
         if self.vsource_node is None:
             raise VsourceNodeDoesNotExists("Vsource node does not exist on this graph.")
-        return nx.dfs_tree(self._graph, source=self.vsource_node)
+        if self._dfs_tree is None:
+            self._dfs_tree = nx.freeze(nx.dfs_tree(self._graph, source=self.vsource_node))
+        return self._dfs_tree
@@ -3,6 +3,7 @@ from collections import defaultdict
 import uuid
 
 import networkx as nx
+import numpy as np
 from networkx.algorithms import approximation as ax
 from loguru import logger
 from gdm import (
@@ -19,8 +20,11 @@ from shift.exceptions import EmptyGraphError
 from shift.graph.base_graph_builder import BaseGraphBuilder
 from shift.graph.distribution_graph import DistributionGraph
 from shift.data_model import GeoLocation, GroupModel, EdgeModel, NodeModel, VALID_NODE_TYPES
-from shift.utils.nearest_points import get_nearest_points
-from shift.utils.split_network_edges import get_distance_between_points
+from shift.utils.nearest_points import get_nearest_point_indices
+from shift.utils.split_network_edges import (
+    get_distance_between_points,
+    get_haversine_distances,
+)
 
 
 class OpenStreetGraphBuilder(BaseGraphBuilder):
@@ -72,28 +76,6 @@ class OpenStreetGraphBuilder(BaseGraphBuilder):
         self.buffer = buffer
         self.point_node_mapping = {}
 
-    @staticmethod
-    def _get_tuple_to_node_mapper(graph: nx.Graph) -> dict[tuple, str]:
-        """Method to build tuple to node mapper.
-
-        Assumes "x" and "y" coordinate values are available
-        in the graph.
-
-        Parameters
-        ----------
-
-        graph: nx.Graph
-            Instance of networkx graph.
-
-        Returns
-        -------
-            dict[tuple, str]
-        """
-
-        return {
-            (data["x"], data["y"]): node for node, data in dict(graph.nodes(data=True)).items()
-        }
-
     def _get_nearest_nodes(self, graph: nx.Graph, points: list[GeoLocation]) -> list[str]:
         """Method to compute nearest nodes in the graph.
 
@@ -112,14 +94,17 @@ class OpenStreetGraphBuilder(BaseGraphBuilder):
         if not graph.nodes:
             msg = f"Empty graph provided. {graph.nodes=}"
             raise EmptyGraphError(msg)
-        graph_nodes_mapper = self._get_tuple_to_node_mapper(graph)
-        nearest_nodes = get_nearest_points(list(graph_nodes_mapper.keys()), points)
-        return [graph_nodes_mapper[tuple(node)] for node in nearest_nodes]
+        nodes = list(graph.nodes)
+        node_coords = [[graph.nodes[node]["x"], graph.nodes[node]["y"]] for node in nodes]
+        return [nodes[idx] for idx in get_nearest_point_indices(node_coords, points)]
 
     @staticmethod
     def _get_steiner_tree(graph: nx.Graph, nearest_nodes: list[str]):
         """Returns steineer tree from a given graph and nearest nodes.
 
+        Edges are weighted by their haversine length in meter computed
+        from "x" and "y" coordinate values of the nodes.
+
         Parameters
         ----------
 
@@ -132,7 +117,15 @@ class OpenStreetGraphBuilder(BaseGraphBuilder):
         -------
         nx.Graph
         """
-        nx.set_edge_attributes(graph, 1, "weight")
+        edges = list(graph.edges)
+        node_x, node_y = graph.nodes(data="x"), graph.nodes(data="y")
+        lengths = get_haversine_distances(
+            np.array([(node_x[u], node_y[u]) for u, *_ in edges], dtype=np.float64),
+            np.array([(node_x[v], node_y[v]) for _, v, *_ in edges], dtype=np.float64),
+        )
+        nx.set_edge_attributes(
+            graph, dict(zip(edges, lengths.to("m").magnitude.tolist())), "weight"
+        )
         return ax.steiner_tree(
             graph,
             nearest_nodes,
@@ -302,19 +295,21 @@ class OpenStreetGraphBuilder(BaseGraphBuilder):
         dist_network = nx.relabel_nodes(
             dist_network, {node: str(node) for node in list(dist_network.nodes)}
         )
-        substation_node = self._get_nearest_nodes(dist_network, [self.source_location])[0]
-        transformer_nodes = self._get_nearest_nodes(dist_network, [c.center for c in self.groups])
+        substation_node, *transformer_nodes = self._get_nearest_nodes(
+            dist_network, [self.source_location] + [c.center for c in self.groups]
+        )
         new_transformer_nodes = []
         for tr_node, group in zip(transformer_nodes, self.groups):
             logger.info(f"Building secondary for {group.center}: {tr_node}")
 
             secondary_graph = self.build_secondary_network(group)
-            sec_loads = self._get_nearest_nodes(secondary_graph, group.points)
-            self.point_node_mapping.update(dict(zip(group.points, sec_loads)))
             tr_location = GeoLocation(
                 dist_network.nodes[tr_node]["x"], dist_network.nodes[tr_node]["y"]
             )
-            nearest_sec_node = self._get_nearest_nodes(secondary_graph, [tr_location])[0]
+            *sec_loads, nearest_sec_node = self._get_nearest_nodes(
+                secondary_graph, group.points + [tr_location]
+            )
+            self.point_node_mapping.update(dict(zip(group.points, sec_loads)))
             dist_network = nx.union(dist_network, secondary_graph)
             new_tr_node_name = str(uuid.uuid4())
             dist_network.add_node(
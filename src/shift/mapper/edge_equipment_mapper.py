@@ -25,6 +25,8 @@ from shift.mapper.base_phase_mapper import BasePhaseMapper
 from shift.mapper.base_voltage_mapper import BaseVoltageMapper
 from shift.constants import EQUIPMENT_TO_CLASS_TYPE
 
+SQRT3 = math.sqrt(3)
+
 
 class EdgeEquipmentMapper(BaseEquipmentMapper):
     """Class interface for selecting edge equipment
@@ -73,31 +75,33 @@ class EdgeEquipmentMapper(BaseEquipmentMapper):
             "kilova",
         )
 
-    def _get_served_load(self, from_node: str, to_node: str) -> PositiveApparentPower:
-        """Internal method to get load served downward from this edge."""
-        dfs_graph = self.graph.get_dfs_tree()
-        parent_node = from_node if dfs_graph.has_edge(from_node, to_node) else to_node
-        descendants = list(nx.descendants(dfs_graph, parent_node))
-        load_nodes = list(
-            self.graph.get_nodes(
-                filter_func=lambda x: x.name in descendants
-                and x.assets is not None
-                and DistributionLoad in x.assets
-            )
-        )
-        served_load = PositiveApparentPower(0, "kilova")
-        for node in load_nodes:
+    @cached_property
+    def _subtree_load_mapping(self) -> dict[str, float]:
+        """Internal property mapping node name to total load in kVA
+        served by that node and all of its descendants."""
+        node_loads: dict[str, float] = {}
+        for node in self.graph.get_nodes(
+            filter_func=lambda x: x.assets is not None and DistributionLoad in x.assets
+        ):
             equipment = self.node_asset_equipment_mapping[node.name][DistributionLoad]
             if not isinstance(equipment, LoadEquipment):
                 msg = f"Wrong {equipment=} used for {node=}"
                 raise WrongEquipmentAssigned(msg)
-            served_load += self._get_load_power(equipment)
-        return served_load
+            node_loads[node.name] = self._get_load_power(equipment).to("kilova").magnitude
+
+        dfs_tree = self.graph.get_dfs_tree()
+        subtree_loads: dict[str, float] = {}
+        for node in nx.dfs_postorder_nodes(dfs_tree, source=self.graph.vsource_node):
+            subtree_loads[node] = node_loads.get(node, 0.0) + sum(
+                subtree_loads[child] for child in dfs_tree.successors(node)
+            )
+        return subtree_loads
 
     def _get_closest_transformer_equipment(
         self, capacity: PositiveApparentPower, num_phase: int, voltages: list[PositiveVoltage]
     ) -> Component:
         """Internal method to return transformer equipment by capacity."""
+        sorted_voltages = sorted(voltages, reverse=True)
 
         def filter_func(x: DistributionTransformerEquipment):
             min_capacity = min([wdg.rated_power.to("kva") for wdg in x.windings])
@@ -109,7 +113,7 @@ class EdgeEquipmentMapper(BaseEquipmentMapper):
                 return False
             wdg_voltages = [wdg.nominal_voltage for wdg in x.windings]
             for v1, v2 in zip(
-                sorted(voltages, reverse=True), sorted(wdg_voltages, reverse=True)[: len(voltages)]
+                sorted_voltages, sorted(wdg_voltages, reverse=True)[: len(voltages)]
             ):
                 if v2 < 0.85 * v1 or v2 >= 1.15 * v1:
                     return False
@@ -163,34 +167,38 @@ class EdgeEquipmentMapper(BaseEquipmentMapper):
     @cached_property
     def edge_equipment_mapping(self) -> dict[str, Component]:
         edge_equipment_mapper = {}
+        dfs_tree = self.graph.get_dfs_tree()
+        subtree_loads = self._subtree_load_mapping
+        node_phases = self.phase_mapper.node_phase_mapping
+        node_voltages = self.voltage_mapper.node_voltage_mapping
+        neutral = set(Phase.N)
+        equipment_class_types = EQUIPMENT_TO_CLASS_TYPE
         for from_node, to_node, edge in self.graph.get_edges():
-            served_load = self._get_served_load(from_node, to_node)
-            from_phases = self.phase_mapper.node_phase_mapping[from_node] - set(Phase.N)
-            to_phases = self.phase_mapper.node_phase_mapping[to_node] - set(Phase.N)
+            child_node = to_node if dfs_tree.has_edge(from_node, to_node) else from_node
+            kva = subtree_loads[child_node]
+            served_load = PositiveApparentPower(kva, "kilova")
+            from_phases = node_phases[from_node] - neutral
+            to_phases = node_phases[to_node] - neutral
             num_phase = min(len(from_phases), len(to_phases))
             if issubclass(edge.edge_type, DistributionTransformer):
                 edge_equipment_mapper[edge.name] = self._get_closest_transformer_equipment(
                     served_load,
                     num_phase,
-                    [
-                        self.voltage_mapper.node_voltage_mapping[from_node],
-                        self.voltage_mapper.node_voltage_mapping[to_node],
-                    ],
+                    [node_voltages[from_node], node_voltages[to_node]],
                 )
             elif issubclass(edge.edge_type, DistributionBranchBase):
-                kv = self.voltage_mapper.node_voltage_mapping[from_node].to("kilovolt").magnitude
-                kva = served_load.to("kilova").magnitude
+                kv = node_voltages[from_node].to("kilovolt").magnitude
                 is_split_phase = Phase.S1 in from_phases or Phase.S2 in from_phases
                 current = (
                     kva / kv
                     if num_phase == 1
                     else kva / (2 * kv)
                     if is_split_phase
-                    else kva / (math.sqrt(3) * kv)
+                    else kva / (SQRT3 * kv)
                 )
 
                 edge_equipment_mapper[edge.name] = self._get_closest_branch_equipment(
-                    EQUIPMENT_TO_CLASS_TYPE[edge.edge_type],
+                    equipment_class_types[edge.edge_type],
                     PositiveCurrent(current, "ampere"),
                     num_phase,
                 )
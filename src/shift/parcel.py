@@ -8,6 +8,7 @@ from shift.data_model import ParcelModel, GeoLocation
 
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 from shapely import wkt
 
@@ -22,38 +23,32 @@ def parcels_from_geodataframe(geo_df: GeoDataFrame) -> list[ParcelModel]:
         list[ParcelModel]
     """
     logger.info(f"Length of geodataframe: {len(geo_df)}, CRS: {geo_df.crs}")
+    geometries = np.asarray(geo_df.geometry.to_numpy(), dtype=object)
+    type_ids = shapely.get_type_id(geometries)
+    is_point = type_ids == shapely.GeometryType.POINT
+    is_multi_polygon = type_ids == shapely.GeometryType.MULTIPOLYGON
+    is_polygon = (type_ids == shapely.GeometryType.POLYGON) | is_multi_polygon
+
+    boundaries = geometries.copy()
+    boundaries[is_multi_polygon] = shapely.convex_hull(geometries[is_multi_polygon])
+    boundaries[is_polygon] = shapely.get_exterior_ring(boundaries[is_polygon])
+    is_supported = is_point | is_polygon
+    coords, coord_index = shapely.get_coordinates(boundaries[is_supported], return_index=True)
+    coords_per_geometry = np.split(
+        coords,
+        np.cumsum(np.bincount(coord_index, minlength=is_supported.sum()))[:-1],
+    )
+
     parcels: list[ParcelModel] = []
-    for idx, geometry in enumerate(geo_df.to_dict(orient="records")):
-        name = f"parcel_{idx}"
-        geometry_obj = geometry["geometry"]
-
-        match geometry_obj.geom_type:
-            case "Point":
-                parcels.append(
-                    ParcelModel(
-                        name=name,
-                        geometry=GeoLocation(*list(geometry_obj.coords)[0]),
-                    )
-                )
-            case "Polygon":
-                parcels.append(
-                    ParcelModel(
-                        name=name,
-                        geometry=[GeoLocation(*coord) for coord in geometry_obj.exterior.coords],
-                    )
-                )
-            case "MultiPolygon":
-                parcels.append(
-                    ParcelModel(
-                        name=name,
-                        geometry=[
-                            GeoLocation(*coord)
-                            for coord in geometry_obj.convex_hull.exterior.coords
-                        ],
-                    )
-                )
-            case _:
-                logger.warning(f"{geometry_obj.geom_type} is not supported.")
+    supported_coords = iter(coords_per_geometry)
+    for idx, geometry_obj in enumerate(geometries):
+        if not is_supported[idx]:
+            logger.warning(f"{getattr(geometry_obj, 'geom_type', None)} is not supported.")
+            continue
+        geometry = [GeoLocation(*coord) for coord in next(supported_coords).tolist()]
+        parcels.append(
+            ParcelModel(name=f"parcel_{idx}", geometry=geometry[0] if is_point[idx] else geometry)
+        )
     logger.info(f"Number of parcels: {len(parcels)}")
     return parcels
 
@@ -27,12 +27,19 @@ def get_kmeans_clusters(num_cluster: int, points: list[GeoLocation]) -> list[Gro
 
     """
 
-    clusters = KMeans(n_clusters=num_cluster, random_state=0).fit(points)
+    points_array = np.ascontiguousarray(points, dtype=np.float64)
+    algorithm = "elkan" if num_cluster > 1 else "lloyd"
+    clusters = KMeans(n_clusters=num_cluster, random_state=0, algorithm=algorithm).fit(
+        points_array
+    )
+    order = np.argsort(clusters.labels_, kind="stable")
+    splits = np.cumsum(np.bincount(clusters.labels_, minlength=num_cluster))[:-1]
+    cluster_points = np.split(points_array[order], splits)
 
     return [
         GroupModel(
             center=GeoLocation(*center),
-            points=[GeoLocation(*el) for el in np.array(points)[clusters.labels_ == idx]],
+            points=[GeoLocation(*el) for el in group_points.tolist()],
         )
-        for idx, center in enumerate(clusters.cluster_centers_)
+        for center, group_points in zip(clusters.cluster_centers_, cluster_points)
     ]
@@ -4,11 +4,10 @@ import networkx as nx
 import numpy as np
 from infrasys.quantities import Distance
 
+from shift.constants import DEGREE_TO_METER
 from shift.data_model import GeoLocation
 from shift.exceptions import EmptyGraphError
 
-DEGREE_TO_METER = 111139
-
 
 def get_mesh_network(
     lower_left: GeoLocation,
@@ -58,7 +57,10 @@ def get_mesh_network(
         )
         raise EmptyGraphError(msg)
 
-    for node in graph.nodes:
-        graph.nodes[node]["x"] = node[0]
-        graph.nodes[node]["y"] = node[1]
-    return nx.relabel_nodes(graph, {node: str(uuid4()) for node in graph.nodes})
+    node_names = {node: str(uuid4()) for node in graph.nodes}
+    mesh_graph = nx.Graph()
+    mesh_graph.add_nodes_from(
+        (name, {"x": node[0], "y": node[1]}) for node, name in node_names.items()
+    )
+    mesh_graph.add_edges_from((node_names[u], node_names[v]) for u, v in graph.edges)
+    return mesh_graph
@@ -24,7 +24,33 @@ def get_nearest_points(source_points: list[list[float]], target_points: list[lis
 
     """
 
+    source_array = np.asarray(source_points)
+    return source_array[get_nearest_point_indices(source_array, target_points)]
+
+
+def get_nearest_point_indices(
+    source_points: list[list[float]], target_points: list[list[float]]
+) -> np.ndarray:
+    """Function to find index of nearest point in `source_points` for all points.
+
+    Parameters
+    ----------
+
+    source_points: list[list[float]]
+        List of list of floats representing points among which
+        to compute nearest points.
+    target_points: list[list[float]]
+        List of list of floats representing points for which
+        index of closest point is to be computed in `source_points`.
+
+    Examples
+    --------
+
+    >>> from shift import get_nearest_point_indices
+    >>> get_nearest_point_indices([[1, 2], [2, 3]], [[4, 5]])
+    array([1])
+
+    """
+
     tree = KDTree(source_points)
-    _, idx = tree.query(target_points, k=1)
-    first_indexes = [el[0] for el in idx]
-    return np.array(source_points)[first_indexes]
+    return tree.query(target_points, k=1, return_distance=False)[:, 0]
@@ -1,6 +1,8 @@
 from infrasys.quantities import Distance
-from shapely import Polygon, MultiPoint, Point
+from shapely import Polygon
+import numpy as np
 
+from shift.constants import DEGREE_TO_METER
 from shift.data_model import GeoLocation
 
 
@@ -28,6 +30,8 @@ def get_polygon_from_points(points: list[GeoLocation], buffer: Distance) -> Poly
     <POLYGON ((-98.33 43.22, -97.32 43.22, -97.32 45.35, -98.33 45.35, -98.33 43...>
     """
 
-    multipoints = MultiPoint([Point(*point) for point in points])
-    minx, miny, maxx, maxy = multipoints.buffer((buffer.to("m") / 111139).magnitude).bounds
+    buffer_degrees = (buffer.to("m") / DEGREE_TO_METER).magnitude
+    coords = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    minx, miny = coords.min(axis=0) - buffer_degrees
+    maxx, maxy = coords.max(axis=0) + buffer_degrees
     return Polygon([(minx, miny), (maxx, miny), (maxx, maxy), (minx, maxy), (minx, miny)])
@@ -9,6 +9,8 @@ from gdm.quantities import PositiveDistance
 
 from shift.data_model import GeoLocation
 
+EARTH_RADIUS_M = 6_371_008.8
+
 
 def get_distance_between_points(
     from_point: GeoLocation, to_point: GeoLocation
@@ -33,6 +35,45 @@ def get_distance_between_points(
     )
 
 
+def get_haversine_distances(
+    from_points: list[GeoLocation] | np.ndarray, to_points: list[GeoLocation] | np.ndarray
+) -> PositiveDistance:
+    """Returns haversine distances between pairs of geo points.
+
+    Distances are computed for all pairs at once using a spherical
+    earth model, which is faster but less accurate than
+    `get_distance_between_points`.
+
+    Parameters
+    ----------
+
+    from_points: list[GeoLocation] | np.ndarray
+        List of from points or (N, 2) array of longitude and latitude.
+    to_points: list[GeoLocation] | np.ndarray
+        List of to points or (N, 2) array, same length as `from_points`.
+
+    Returns
+    -------
+    PositiveDistance
+        Distances in meter for each pair of points.
+
+    Examples
+    --------
+
+    >>> get_haversine_distances([GeoLocation(-97.33, 45.56)], [GeoLocation(-97.32, 45.58)])
+    <Quantity([2356.19521878], 'meter')>
+    """
+
+    from_array = np.radians(np.asarray(from_points, dtype=np.float64).reshape(-1, 2))
+    to_array = np.radians(np.asarray(to_points, dtype=np.float64).reshape(-1, 2))
+    dlon, dlat = (to_array - from_array).T
+    a = (
+        np.sin(dlat / 2) ** 2
+        + np.cos(from_array[:, 1]) * np.cos(to_array[:, 1]) * np.sin(dlon / 2) ** 2
+    )
+    return PositiveDistance(2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(a)), "m")
+
+
 def split_network_edges(graph: nx.Graph, split_length: Distance) -> nx.Graph:
     """Creates a new graph with edges sliced by given distance in meter.
 
@@ -60,8 +101,9 @@ def split_network_edges(graph: nx.Graph, split_length: Distance) -> nx.Graph:
     >>> split_network_edges(graph, split_length=Distance(50, "m"))
     """
     sliced_graph = copy.deepcopy(graph)
-    graph_nodes = dict(graph.nodes(data=True))
+    graph_nodes = graph.nodes
     split_length_m = split_length.to("m").magnitude
+    removed_edges, new_nodes, new_edges = [], [], []
     for edge in graph.edges():
         from_point = GeoLocation(graph_nodes[edge[0]]["x"], graph_nodes[edge[0]]["y"])
         to_point = GeoLocation(graph_nodes[edge[1]]["x"], graph_nodes[edge[1]]["y"])
@@ -69,21 +111,20 @@ def split_network_edges(graph: nx.Graph, split_length: Distance) -> nx.Graph:
         if edge_length_m <= split_length_m:
             continue
 
-        sliced_graph.remove_edge(*edge)
-        edge_slices = [x / edge_length_m for x in np.arange(1, edge_length_m, split_length_m)]
-
-        x1, y1 = (from_point.longitude, from_point.latitude)
-        x2, y2 = (to_point.longitude, to_point.latitude)
-
-        sliced_nodes = []
-        for slice_ in edge_slices:
-            node_name = str(uuid.uuid4())
-            new_x, new_y = x1 + (x2 - x1) * slice_, y1 + (y2 - y1) * slice_
-            sliced_graph.add_node(node_name, x=new_x, y=new_y)
-            sliced_nodes.append(node_name)
+        removed_edges.append(edge)
+        edge_slices = np.arange(1, edge_length_m, split_length_m) / edge_length_m
+        new_xs = from_point.longitude + (to_point.longitude - from_point.longitude) * edge_slices
+        new_ys = from_point.latitude + (to_point.latitude - from_point.latitude) * edge_slices
 
+        sliced_nodes = [str(uuid.uuid4()) for _ in edge_slices]
+        new_nodes.extend(
+            (node_name, {"x": new_x, "y": new_y})
+            for node_name, new_x, new_y in zip(sliced_nodes, new_xs.tolist(), new_ys.tolist())
+        )
         sliced_nodes = [edge[0]] + sliced_nodes + [edge[1]]
-        for i in range(len(sliced_nodes) - 1):
-            sliced_graph.add_edge(sliced_nodes[i], sliced_nodes[i + 1])
+        new_edges.extend(zip(sliced_nodes[:-1], sliced_nodes[1:]))
 
+    sliced_graph.remove_edges_from(removed_edges)
+    sliced_graph.add_nodes_from(new_nodes)
+    sliced_graph.add_edges_from(new_edges)
     return sliced_graph
@@ -0,0 +1,106 @@
+from functools import cached_property
+from types import SimpleNamespace
+
+import pytest
+from gdm import (
+    DistributionLoad,
+    DistributionVoltageSource,
+    LoadEquipment,
+    MatrixImpedanceBranch,
+    Phase,
+    PhaseLoadEquipment,
+)
+from gdm.quantities import ActivePower, PositiveDistance, PositiveVoltage, ReactivePower
+from infrasys import Location
+
+from shift import DistributionGraph, NodeModel, EdgeModel
+from shift.mapper.edge_equipment_mapper import EdgeEquipmentMapper
+
+NODE_LOADS_KW = {"a_1": 2.0, "a_2": 3.0, "b_1": 5.0}
+
+
+def get_load_equipment(name: str, kw: float) -> LoadEquipment:
+    """Function to return single phase load equipment with `kw` apparent power."""
+    return LoadEquipment(
+        name=name,
+        phase_loads=[
+            PhaseLoadEquipment(
+                name=f"{name}_phase",
+                real_power=ActivePower(kw, "kilowatt"),
+                reactive_power=ReactivePower(0, "kilovar"),
+                z_real=1.0,
+                z_imag=0.0,
+                i_real=0.0,
+                i_imag=0.0,
+                p_real=0.0,
+                p_imag=0.0,
+            )
+        ],
+    )
+
+
+class StubLoadMapper(EdgeEquipmentMapper):
+    """Edge equipment mapper with load equipment stubbed for load nodes.
+
+    Branch equipment lookup returns the current it is asked to serve.
+    """
+
+    @cached_property
+    def node_asset_equipment_mapping(self):
+        return {
+            name: {DistributionLoad: get_load_equipment(name, kw)}
+            for name, kw in NODE_LOADS_KW.items()
+        }
+
+    def _get_closest_branch_equipment(self, type_, current, num_phase):
+        return current
+
+
+@pytest.fixture
+def branched_graph():
+    graph = DistributionGraph()
+    # Load nodes are added first so that some edges are reported child to parent.
+    for idx, name in enumerate(NODE_LOADS_KW):
+        graph.add_node(
+            NodeModel(name=name, location=Location(x=idx, y=2), assets={DistributionLoad})
+        )
+    graph.add_node(NodeModel(name="parent", location=Location(x=0, y=1)))
+    graph.add_node(
+        NodeModel(name="source", location=Location(x=0, y=0), assets={DistributionVoltageSource})
+    )
+    for from_node, to_node in [
+        ("source", "parent"),
+        ("parent", "a_1"),
+        ("a_1", "a_2"),
+        ("b_1", "parent"),
+    ]:
+        graph.add_edge(
+            from_node,
+            to_node,
+            edge_data=EdgeModel(
+                name=f"{from_node}_{to_node}",
+                edge_type=MatrixImpedanceBranch,
+                length=PositiveDistance(1, "m"),
+            ),
+        )
+    yield graph
+
+
+def test_served_load_only_includes_own_subtree(branched_graph):
+    node_names = [node.name for node in branched_graph.get_nodes()]
+    mapper = StubLoadMapper(
+        branched_graph,
+        None,
+        SimpleNamespace(
+            node_voltage_mapping={name: PositiveVoltage(1, "kilovolt") for name in node_names}
+        ),
+        SimpleNamespace(node_phase_mapping={name: {Phase.A} for name in node_names}),
+    )
+    served_currents = {
+        name: current.to("ampere").magnitude
+        for name, current in mapper.edge_equipment_mapping.items()
+    }
+
+    assert served_currents == pytest.approx(
+        {"source_parent": 10.0, "parent_a_1": 5.0, "a_1_a_2": 3.0, "b_1_parent": 5.0}
+    )
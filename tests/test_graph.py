@@ -65,6 +65,70 @@ def test_nodes_addition(distribution_graph):
     )
 
 
+def test_nodes_addition_from_generator():
+    graph = DistributionGraph()
+    graph.add_nodes(
+        NodeModel(name=f"node_{idx}", location=Location(x=-93.33, y=45.56)) for idx in range(3)
+    )
+    assert len(list(graph.get_nodes())) == 3
+
+
+def test_nodes_addition_is_validated_before_adding(distribution_graph):
+    with pytest.raises(NodeAlreadyExists) as _:
+        distribution_graph.add_nodes(
+            [
+                NodeModel(name="node_4", location=Location(x=-93.33, y=45.56)),
+                NodeModel(name="node_1", location=Location(x=-93.33, y=45.56)),
+            ]
+        )
+    assert not distribution_graph.has_node("node_4")
+
+    with pytest.raises(NodeAlreadyExists, match="node_6"):
+        distribution_graph.add_nodes(
+            [
+                NodeModel(name="node_6", location=Location(x=-93.33, y=45.56)),
+                NodeModel(name="node_6", location=Location(x=-93.33, y=45.56)),
+            ]
+        )
+    assert not distribution_graph.has_node("node_6")
+
+    with pytest.raises(VsourceNodeAlreadyExists) as _:
+        distribution_graph.add_nodes(
+            [
+                NodeModel(
+                    name="node_5",
+                    location=Location(x=0, y=0),
+                    assets={DistributionVoltageSource},
+                )
+            ]
+        )
+
+
+def test_edges_addition():
+    graph = DistributionGraph()
+    graph.add_nodes(
+        [
+            NodeModel(name="node_1", location=Location(x=1, y=1)),
+            NodeModel(name="node_2", location=Location(x=1, y=2)),
+            NodeModel(name="node_3", location=Location(x=1, y=3)),
+        ]
+    )
+    edge_1 = EdgeModel(
+        name="line-1", edge_type=DistributionBranchBase, length=PositiveDistance(1, "m")
+    )
+    edge_2 = EdgeModel(
+        name="line-2", edge_type=DistributionBranchBase, length=PositiveDistance(1, "m")
+    )
+    graph.add_edges([("node_1", "node_2", edge_1), ("node_2", "node_3", edge_2)])
+    assert graph.get_edge("node_2", "node_1") == edge_1
+    assert graph.get_edge("node_2", "node_3") == edge_2
+
+    with pytest.raises(EdgeAlreadyExists) as _:
+        graph.add_edges([("node_1", "node_3", edge_1), ("node_3", "node_1", edge_2)])
+    with pytest.raises(NodeDoesNotExist) as _:
+        graph.add_edges([("node_1", "node_4", edge_1)])
+
+
 def test_edge_addition():
     graph = DistributionGraph()
     node_1 = NodeModel(name="node_1", location=Location(x=1, y=1))
@@ -130,3 +194,18 @@ def test_querying_edge_that_does_not_exist():
     graph = DistributionGraph()
     with pytest.raises(EdgeDoesNotExist) as _:
         graph.get_edge("node_1", "node_2")
+
+
+def test_dfs_tree_is_reused_until_graph_changes(distribution_graph):
+    dfs_tree = distribution_graph.get_dfs_tree()
+    assert distribution_graph.get_dfs_tree() is dfs_tree
+    distribution_graph.add_edge(
+        "node_3",
+        NodeModel(name="node_4", location=Location(x=-93.35, y=45.59)),
+        edge_data=EdgeModel(
+            name="line-3", edge_type=DistributionBranchBase, length=PositiveDistance(1, "m")
+        ),
+    )
+    updated_dfs_tree = distribution_graph.get_dfs_tree()
+    assert updated_dfs_tree is not dfs_tree
+    assert updated_dfs_tree.has_edge("node_3", "node_4")
@@ -0,0 +1,38 @@
+import networkx as nx
+import pytest
+from infrasys.quantities import Distance
+
+from shift import GeoLocation, split_network_edges
+from shift.graph.openstreet_graph_builder import OpenStreetGraphBuilder
+from shift.utils.split_network_edges import get_distance_between_points
+
+
+@pytest.fixture
+def road_network():
+    """Fixture returning multigraph shaped like `get_road_network` output."""
+    road_graph = nx.MultiDiGraph()
+    for idx in range(4):
+        for idy in range(4):
+            road_graph.add_node((idx, idy), x=-97.33 + idx * 0.001, y=32.75 + idy * 0.001)
+    for idx in range(4):
+        for idy in range(4):
+            if idx < 3:
+                road_graph.add_edge((idx, idy), (idx + 1, idy))
+            if idy < 3:
+                road_graph.add_edge((idx, idy), (idx, idy + 1))
+    yield split_network_edges(
+        nx.minimum_spanning_tree(road_graph.to_undirected()), split_length=Distance(50, "m")
+    )
+
+
+def test_steiner_tree_on_road_network_multigraph(road_network):
+    assert road_network.is_multigraph()
+
+    steiner_tree = OpenStreetGraphBuilder._get_steiner_tree(road_network, [(0, 0), (3, 3), (0, 3)])
+    assert nx.is_tree(steiner_tree)
+    for u, v, weight in road_network.edges(data="weight"):
+        expected = get_distance_between_points(
+            GeoLocation(road_network.nodes[u]["x"], road_network.nodes[u]["y"]),
+            GeoLocation(road_network.nodes[v]["x"], road_network.nodes[v]["y"]),
+        )
+        assert weight == pytest.approx(expected.to("m").magnitude, rel=5e-3)
@@ -5,9 +5,9 @@ from unittest import mock
 import pytest
 from infrasys.quantities import Distance
 import geopandas as gpd
-from shapely import Point, Polygon
+from shapely import LineString, MultiPolygon, Point, Polygon
 
-from shift import GeoLocation, ParcelModel, parcels_from_location
+from shift import GeoLocation, ParcelModel, parcels_from_location, parcels_from_geodataframe
 
 GET_PARCEL_INPUTS = [
     ["Fort Worth, TX", Distance(300, "m")],
@@ -84,3 +84,26 @@ def test_get_parcels_with_polygon(mock_ox):
 
     assert len(result) == 2
     assert isinstance(result[0], ParcelModel)
+
+
+def test_parcels_from_geodataframe_with_mixed_geometries():
+    """Test parcels from geodataframe with supported and unsupported geometries."""
+    geo_df = gpd.GeoDataFrame(
+        geometry=[
+            LineString([(0, 0), (1, 1)]),
+            MultiPolygon(
+                [
+                    Polygon([(0, 0), (0, 1), (1, 1), (0, 0)]),
+                    Polygon([(2, 0), (2, 1), (3, 0), (2, 0)]),
+                ]
+            ),
+            Point(1, 2),
+        ]
+    )
+    result = parcels_from_geodataframe(geo_df)
+
+    assert [parcel.name for parcel in result] == ["parcel_1", "parcel_2"]
+    assert result[0].geometry == [
+        GeoLocation(*coord) for coord in geo_df.geometry[1].convex_hull.exterior.coords
+    ]
+    assert result[1].geometry == GeoLocation(1, 2)
@@ -1,3 +1,5 @@
+import warnings
+
 import numpy as np
 from infrasys.quantities import Distance
 import pytest
@@ -6,6 +8,7 @@ import networkx as nx
 
 from shift import (
     get_nearest_points,
+    get_nearest_point_indices,
     GeoLocation,
     get_kmeans_clusters,
     GroupModel,
@@ -13,6 +16,7 @@ from shift import (
     get_polygon_from_points,
     split_network_edges,
 )
+from shift.utils.split_network_edges import get_distance_between_points, get_haversine_distances
 
 
 TEST_NEAREST_NODE_INPUTS = [{"input": [[[1, 2], [2, 3]], [[4, 4]]], "output": [[2, 3]]}]
@@ -25,6 +29,13 @@ def test_nearest_node(data):
     assert np.array_equal(nearest_node, data["output"])
 
 
+def test_nearest_point_indices_with_duplicate_points():
+    """Test function to check nearest point indices are returned for duplicate points."""
+    indices = get_nearest_point_indices([[1, 2], [2, 3], [2, 3]], [[4, 4], [1, 1]])
+    assert indices[0] in (1, 2)
+    assert indices[1] == 0
+
+
 TEST_CLUSTER_POINTS = [
     [
         2,
@@ -55,6 +66,15 @@ def test_point_clustering(input):
     assert isinstance(clusters[0], GroupModel)
 
 
+def test_single_cluster_does_not_warn():
+    """Test single cluster is computed without warnings."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        clusters = get_kmeans_clusters(1, TEST_CLUSTER_POINTS[0][1])
+    assert len(clusters) == 1
+    assert len(clusters[0].points) == len(TEST_CLUSTER_POINTS[0][1])
+
+
 TEST_POLYGON_POINTS = [[[[-97.32, 43.22], [-98.33, 45.35]], Distance(20, "m")]]
 
 
@@ -86,3 +106,16 @@ def test_split_network_edges():
     graph.add_node("node_2", x=-97.32, y=45.58)
     graph.add_edge("node_1", "node_2")
     split_network_edges(graph, split_length=Distance(50, "m"))
+
+
+def test_haversine_distances():
+    """Function to test batched haversine distances."""
+
+    from_points = [GeoLocation(-97.33, 45.56), GeoLocation(-73.935242, 40.730610)]
+    to_points = [GeoLocation(-97.32, 45.58), GeoLocation(-73.934657, 40.731008)]
+    distances = get_haversine_distances(from_points, to_points).to("m").magnitude
+    expected = [
+        get_distance_between_points(*pair).to("m").magnitude
+        for pair in zip(from_points, to_points)
+    ]
+    assert np.allclose(distances, expected, rtol=5e-3)